@@ -1,15 +1,70 @@
 #!/bin/python3
-import argparse
+from __future__ import annotations
+import math
 import random
-from copy import deepcopy
+import sys
+from typing import Callable
+
+# Batched-path backends, imported on first use by _load_batch_backend
+# so that plain rolls never pay the numpy/numba import cost.
+np = None
+rng = None
+njit = None # numba is optional -- fall back to the NumPy batched path.
+prange = range
+
+def _load_batch_backend():
+    """Import numpy (and numba when available) on the first batched roll."""
+    global np, rng, njit, prange
+    if np is not None:
+        return
+    import numpy
+    np = numpy
+    rng = np.random.default_rng()
+    try:
+        from numba import njit as _njit, prange as _prange
+    except ImportError:
+        return
+    njit, prange = _njit, _prange
 
 # Set constants.
 INSTRCTN_ARR: list[str] = ['d', '+', '-', 'r', 't', 'l', 'h', 'A', 'D', 'E']
 SPEC_ARR: list[str] = ['+', '-', 'r', 't', 'l', 'h'] # list of specs.
 SPEC_DEFS: dict[str, int] = {spec: 0 for spec in SPEC_ARR} # spec def. values.
+_INSTRCTN_SET: frozenset[str] = frozenset(INSTRCTN_ARR)
+_SPEC_SET: frozenset[str] = frozenset(SPEC_ARR)
+# 'A', 'D', and 'E' are shorthands for an n_rolls + drop spec pair.
+_SHORTHAND: dict[str, tuple[int, str]] = {
+    'A': (2, "l1"), 'D': (2, "h1"), 'E': (3, "l2")
+}
 N_FREQTEST: int = int(1e5) # Number of rolls for a frequentist test.
 REGULAR_POLYHEDRA: list[int] = [4, 6, 8, 10, 12, 20, 100] # regular polyhedra.
 
+def batched_bounded(rng: np.random.Generator, bound, size,
+                    dtype = None) -> np.ndarray:
+    """Draw uniform ints in [0, bound) for every cell of `size` at once.
+
+    Applies Lemire's multiply-and-shift trick to one 32-bit random word
+    per cell: (word * bound) >> 32. Division-free, one RNG word per
+    output. The rejection step is skipped: the bias is at most
+    bound / 2^32, far below anything observable for dice-sized bounds.
+    `bound` may be a scalar or an array broadcastable to `size`.
+    """
+    _load_batch_backend()
+    words: np.ndarray = rng.integers(0, 1 << 32, size = size,
+                                     dtype = np.uint64)
+    bound = np.asarray(bound, dtype = np.uint64)
+    return ((words * bound) >> np.uint64(32)) \
+        .astype(np.int32 if dtype is None else dtype)
+
+def _roll_dtype(n_faces: int):
+    """Smallest dtype holding a face of an n_faces die. The batched
+    roll matrices are memory-bound, so narrower cells cut the
+    bandwidth of the reroll/partition/sum steps.
+    """
+    if n_faces < 1 << 8:  return np.uint8
+    if n_faces < 1 << 15: return np.int16
+    return np.int32
+
 class dice:
     """
     Class for the dice to be rolled.
@@ -32,6 +87,25 @@ class dice:
     n_lowest_dropped: int = SPEC_DEFS['l']
     n_highest_dropped: int = SPEC_DEFS['h']
 
+    # Spec-char accessors -- one dict lookup instead of an if/elif
+    # chain per call. The 'r' setter folds in the 0 -> unlimited case.
+    _GETTERS: dict[str, Callable[["dice"], int]] = {
+        '+': lambda d: d.bonus,
+        '-': lambda d: d.bonus,
+        'r': lambda d: d.n_rerolls,
+        't': lambda d: d.reroll_threshold,
+        'l': lambda d: d.n_lowest_dropped,
+        'h': lambda d: d.n_highest_dropped,
+    }
+    _SETTERS: dict[str, Callable[["dice", int], None]] = {
+        '+': lambda d, v: setattr(d, "bonus", d.bonus + v),
+        '-': lambda d, v: setattr(d, "bonus", d.bonus - v),
+        'r': lambda d, v: setattr(d, "n_rerolls", v if v else -1),
+        't': lambda d, v: setattr(d, "reroll_threshold", v),
+        'l': lambda d, v: setattr(d, "n_lowest_dropped", v),
+        'h': lambda d, v: setattr(d, "n_highest_dropped", v),
+    }
+
     def __init__(self, roll: str):
         # Format and sanitize input string.
         dice_arr: list[str] = roll.split('d')
@@ -42,33 +116,30 @@ class dice:
         # Initialize dice.
         self.n_rolls, self.n_faces = list(map(int, dice_arr))
 
+        # Power-of-two dice (d4, d8, ...) can mask random bits directly
+        # instead of going through randint's rejection loop.
+        self._is_pow2: bool = self.n_faces & (self.n_faces - 1) == 0
+        self._bits: int = self.n_faces.bit_length() - 1
+        self._getrandbits = random.getrandbits
+
     def get(self, s: str) -> int:
         """Get a dice parameter using a char."""
-        if s == '+': return self.bonus
-        if s == '-': return self.bonus
-        if s == 'r': return self.n_rerolls
-        if s == 't': return self.reroll_threshold
-        if s == 'l': return self.n_lowest_dropped
-        if s == 'h': return self.n_highest_dropped
-        raise ValueError("Invalid spec %s." % s)
+        if s not in self._GETTERS:
+            raise ValueError("Invalid spec %s." % s)
+        return self._GETTERS[s](self)
 
     def set(self, s: str, v: int):
         """Set a dice parameter using a char."""
-        if   s == '+': self.bonus += v
-        elif s == '-': self.bonus -= v
-        elif s == 'r' and v == 0: self.n_rerolls = -1
-        elif s == 'r': self.n_rerolls         = v
-        elif s == 't': self.reroll_threshold  = v
-        elif s == 'l': self.n_lowest_dropped  = v
-        elif s == 'h': self.n_highest_dropped = v
-        else: raise ValueError("Invalid spec %s." % s)
+        if s not in self._SETTERS:
+            raise ValueError("Invalid spec %s." % s)
+        self._SETTERS[s](self, v)
 
     def add_spec(self, spec: str):
         """Define a spec for the dice, checking for errors along the way."""
-        val_arr: list[bool] = [bool(spec.find(x)+1) for x in SPEC_ARR]
-        if not any(val_arr) or sum(val_arr) != 1:
+        vals: set[str] = {c for c in spec if c in _SPEC_SET}
+        if len(vals) != 1:
             raise ValueError("Spec %s is invalid." % spec)
-        val: str = SPEC_ARR[val_arr.index(True)]
+        val: str = vals.pop()
 
         if self.get(val) != SPEC_DEFS[val]:
             if val == '+' or val == '-':
@@ -106,13 +177,14 @@ class dice:
 
     def roll(self) -> int:
         """Roll one die from the dice object."""
-        # Roll the die.
-        x: int = random.choice(range(self.n_faces)) + 1
-
-        # Re-roll if needed.
-        if x <= self.reroll_threshold and self.n_rerolls != 0:
-            self.n_rerolls -= 1
-            x = self.roll()
+        # Roll the die, re-rolling if needed. The budget is a local so
+        # `roll` never mutates the dice.
+        rem: int = self.n_rerolls
+        while True:
+            if self._is_pow2: x: int = self._getrandbits(self._bits) + 1
+            else:             x = random.randint(1, self.n_faces)
+            if x > self.reroll_threshold or rem == 0: break
+            rem -= 1
 
         return x + self.bonus
 
@@ -121,13 +193,64 @@ class dice:
         # Roll the dice.
         rolls: list[int] = [self.roll() for _ in range(self.n_rolls)]
 
-        # Remove lowest or highest if needed and rerolls remain.
-        for _ in range(self.n_lowest_dropped):  rolls.remove(min(rolls))
-        for _ in range(self.n_highest_dropped): rolls.remove(max(rolls))
+        # Remove lowest or highest if needed. A single sort beats the
+        # O(n) min/remove scan per dropped die.
+        if self.n_lowest_dropped or self.n_highest_dropped:
+            rolls.sort()
+            rolls = rolls[self.n_lowest_dropped
+                          : len(rolls) - self.n_highest_dropped]
 
         # Return sum of rolls.
         return sum(rolls)
 
+    def roll_batch(self, n_tests: int) -> np.ndarray:
+        """Roll all dice in the object n_tests times at once."""
+        _load_batch_backend()
+
+        # Roll the dice for every test in one draw.
+        dtype = _roll_dtype(self.n_faces)
+        rolls: np.ndarray = batched_bounded(
+            rng, self.n_faces, (n_tests, self.n_rolls), dtype
+        ) + 1
+
+        # Re-roll if needed, resampling only the offending entries.
+        rem: int = self._n_reroll_passes()
+        while rem != 0:
+            mask: np.ndarray = rolls <= self.reroll_threshold
+            n_bad: int = int(mask.sum())
+            if n_bad == 0: break
+            rolls[mask] = batched_bounded(rng, self.n_faces, n_bad, dtype) + 1
+            rem -= 1
+
+        return self._drop_and_sum(rolls)
+
+    def _n_reroll_passes(self) -> int:
+        """Reroll budget for the batched paths. The unlimited case is
+        capped so the chance of a low roll surviving every pass is
+        below ~1e-12 -- each pass keeps a fraction
+        p = reroll_threshold / n_faces of its mask.
+        """
+        if self.n_rerolls >= 0 or self.reroll_threshold <= 0:
+            return max(self.n_rerolls, 0)
+        p: float = self.reroll_threshold / self.n_faces
+        return math.ceil(math.log(1e-12) / math.log(p))
+
+    def _drop_and_sum(self, rolls: np.ndarray) -> np.ndarray:
+        """Drop lowest/highest via a partial sort and sum each test row,
+        applying the bonus per kept die.
+        """
+        if self.n_lowest_dropped:
+            rolls = np.partition(rolls, self.n_lowest_dropped-1, axis = 1)
+            rolls = rolls[:, self.n_lowest_dropped:]
+        if self.n_highest_dropped:
+            kth: int = rolls.shape[1] - self.n_highest_dropped
+            rolls = np.partition(rolls, kth, axis = 1)[:, :kth]
+
+        # Promote on the fly: the cells may be as narrow as uint8 and
+        # the bonus may be negative.
+        return rolls.sum(axis = 1, dtype = np.int32) \
+             + rolls.shape[1] * self.bonus
+
     def print(self):
         """Print the dice parameters."""
         print("Dice is:")
@@ -139,11 +262,93 @@ class dice:
         print("  * n_lowest_dropped  : %d" % self.n_lowest_dropped)
         print("  * n_highest_dropped : %d" % self.n_highest_dropped)
 
+def roll_batch_all(dice_arr: list[dice], n_tests: int) -> np.ndarray:
+    """Roll every die in dice_arr n_tests times in one wide draw.
+
+    Gathers the per-die parameters into parallel arrays so a single
+    batched_bounded call covers all dice at once; dice with fewer rolls
+    are padded up to the widest and the padding columns are masked out.
+    The drop/sum step runs per die since the drop counts are ragged.
+    Returns a (n_tests, n_dice) matrix of roll sums.
+    """
+    _load_batch_backend()
+    n_faces: np.ndarray = np.array([d.n_faces for d in dice_arr])[:, None]
+    n_rolls: np.ndarray = np.array([d.n_rolls for d in dice_arr])
+    thresholds: np.ndarray = \
+        np.array([d.reroll_threshold for d in dice_arr])[:, None]
+    passes: np.ndarray = np.array([d._n_reroll_passes() for d in dice_arr])
+    max_rolls: int = int(n_rolls.max())
+
+    # One draw for the whole buffer; per-die bounds broadcast over the
+    # padded rolls axis.
+    dtype = _roll_dtype(int(n_faces.max()))
+    rolls: np.ndarray = batched_bounded(
+        rng, n_faces, (n_tests, len(dice_arr), max_rolls), dtype
+    ) + 1
+    valid: np.ndarray = np.arange(max_rolls) < n_rolls[:, None]
+
+    # Re-roll if needed, resampling only the offending entries of dice
+    # with budget left in each pass.
+    for i_pass in range(int(passes.max())):
+        mask: np.ndarray = (rolls <= thresholds) & valid \
+                         & (passes > i_pass)[:, None]
+        n_bad: int = int(mask.sum())
+        if n_bad == 0: break
+        bounds: np.ndarray = np.broadcast_to(n_faces, rolls.shape)[mask]
+        rolls[mask] = batched_bounded(rng, bounds, n_bad) + 1
+
+    # Drop and sum per die.
+    out: np.ndarray = np.empty((n_tests, len(dice_arr)), dtype = np.int64)
+    for i_die, d in enumerate(dice_arr):
+        out[:, i_die] = d._drop_and_sum(rolls[:, i_die, :d.n_rolls])
+    return out
+
+def make_kernel(d: dice) -> Callable[[int], np.ndarray]:
+    """Build a kernel rolling one die n_tests times, returning per-test sums.
+
+    Pure-integer kernel compiled with numba when available, bypassing
+    Python bytecode dispatch in the innermost loop. Tests are
+    independent, so they are spread across cores with prange. The die's
+    parameters are closed over: numba compiles them as literals, so the
+    small inner loops unroll and the drop bounds become constants.
+    Compiled kernels are cached on disk per parameter set.
+    """
+    n_faces: int = d.n_faces
+    n_rolls: int = d.n_rolls
+    n_rerolls: int = d.n_rerolls
+    reroll_threshold: int = d.reroll_threshold
+    n_low: int = d.n_lowest_dropped
+    n_high: int = d.n_highest_dropped
+    bonus: int = d.bonus
+
+    def kernel(n_tests: int) -> np.ndarray:
+        out = np.empty(n_tests, dtype = np.int64)
+        for i in prange(n_tests):
+            buf = np.empty(n_rolls, dtype = np.int32)
+            for j in range(n_rolls):
+                x = np.random.randint(1, n_faces+1)
+                rem = n_rerolls
+                while x <= reroll_threshold and rem != 0:
+                    x = np.random.randint(1, n_faces+1)
+                    rem -= 1
+                buf[j] = x
+            buf.sort()
+            out[i] = buf[n_low:n_rolls-n_high].sum() \
+                   + (n_rolls - n_low - n_high) * bonus
+        return out
+
+    if njit is None:
+        return kernel
+    return njit(parallel = True, cache = True)(kernel)
+
 def run_parser() -> argparse.Namespace:
     """Setup and run the program's parser."""
+    import argparse
+    # Only read the readme when help will actually be shown.
     DESC: str = ""
-    with open("readme.md", 'r') as f:
-        DESC = f.read()
+    if '-h' in sys.argv or '--help' in sys.argv:
+        with open("readme.md", 'r') as f:
+            DESC = f.read()
     HELP_0: str = "string of rolls to be performed."
     HELP_T: str = "number of times the roll should be performed."
     HELP_F: str = "set this flag to test with 100k rolls."
@@ -170,62 +375,66 @@ def process_rolls(rolls: str) -> list[dice]:
     """Process roll instruction from string and generate list of dice."""
     dice_arr: list[dice] = []
     for spec in rolls:
-        # Get instruction.
-        instruction: list[bool] = [bool(spec.find(x)+1) for x in INSTRCTN_ARR]
+        # Get instruction with a single pass over the token.
+        kinds: set[str] = {c for c in spec if c in _INSTRCTN_SET}
+        if len(kinds) != 1:
+            raise ValueError("Input roll is malformed.")
+        kind: str = kinds.pop()
 
         # Process instruction.
-        if sum(instruction) != 1:
-            raise ValueError("Input roll is malformed.")
-        elif instruction[0]: # 'd'
+        if kind == 'd':
             dice_arr.append(dice(spec))
         elif len(dice_arr) == 0:
             raise ValueError("Define dice before adding specs to it.")
-        elif any(instruction[1:7]): # '+', '-', 'r', 't', 'l', and 'h'.
+        elif kind in _SPEC_SET: # '+', '-', 'r', 't', 'l', and 'h'.
             dice_arr[-1].add_spec(spec)
-        elif any(instruction[7:9]) and dice_arr[-1].n_rolls != 1:
+        elif dice_arr[-1].n_rolls != 1:
             raise ValueError("A, D, and E only work if n_rolls is 1.")
-        elif instruction[7]: # 'A'.
-            dice_arr[-1].n_rolls = 2
-            dice_arr[-1].add_spec("l1")
-        elif instruction[8]: # 'D'.
-            dice_arr[-1].n_rolls = 2
-            dice_arr[-1].add_spec("h1")
-        elif instruction[9]: # 'E'.
-            dice_arr[-1].n_rolls = 3
-            dice_arr[-1].add_spec("l2")
+        else: # 'A', 'D', and 'E'.
+            dice_arr[-1].n_rolls, drop_spec = _SHORTHAND[kind]
+            dice_arr[-1].add_spec(drop_spec)
 
     return dice_arr
 
 def print_header(dice_arr: list[dice]):
     """Print header for both frequentist test and normal rolling."""
-    print("        | ", end = '')
-    for d in dice_arr:
-        print("%5s " % ("%dd%d" % (d.n_rolls, d.n_faces)), end = '')
+    sys.stdout.write("        | " + ''.join(
+        "%5s " % ("%dd%d" % (d.n_rolls, d.n_faces)) for d in dice_arr
+    ))
 
 def perform_freqtest(dice_arr: list[dice]):
     """Perform a frequency test and print roll averages."""
-    sum_arr: list[int] = [0 for _ in dice_arr]
-
-    # Make rolls and update sum.
-    for i_test in range(N_FREQTEST):
-        for i_die, d in enumerate(dice_arr):
-            sum_arr[i_die] += deepcopy(d).roll_n()
+    # Make all rolls in one batch per die and sum over tests.
+    _load_batch_backend()
+    if njit is not None:
+        sum_arr: list[int] = [
+            int(make_kernel(d)(N_FREQTEST).sum()) for d in dice_arr
+        ]
+    else:
+        sum_arr: list[int] = [
+            int(s) for s in roll_batch_all(dice_arr, N_FREQTEST).sum(axis = 0)
+        ]
 
     # Print test result.
     print_header(dice_arr)
-    print("\nAverage | ", end = '')
-    for result in sum_arr:
-        print("%5.1f " % (result / N_FREQTEST), end = '')
-    print('')
+    sys.stdout.write("\nAverage | " + ''.join(
+        "%5.1f " % (result / N_FREQTEST) for result in sum_arr
+    ) + '\n')
 
 def make_rolls(dice_arr: list[dice], n_tests: int):
     """Make rolls and print results."""
     print_header(dice_arr)
+
+    # Bind the writer and cell formatter once outside the loop. Each
+    # row is one string and one write: no lock acquire, flush check, or
+    # attribute lookup per result.
+    write: Callable[[str], int] = sys.stdout.write
+    fmt: Callable[[int], str] = "%5d ".__mod__
     for i_test in range(n_tests):
-        print("\nRoll %2d | " % (i_test+1), end = '')
-        for result in [d.roll_n() for d in deepcopy(dice_arr)]:
-            print("%5d " % result, end = '')
-    print('')
+        write("\nRoll %2d | " % (i_test+1) + ''.join(
+            fmt(d.roll_n()) for d in dice_arr
+        ))
+    write('\n')
 
 def main() -> int:
     # Parse arguments.